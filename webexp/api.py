@@ -2,15 +2,34 @@
 
 from __future__ import annotations
 
+import atexit
+import functools
+import hashlib
 import json
 import logging
+import mmap
 import os
+import secrets
+import shutil
+import struct
 import tempfile
 import threading
-import uuid
-import zipfile
-from datetime import datetime
-from typing import Any, Callable, Dict
+import time
+import zlib
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import (
+    Any,
+    AsyncIterator,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    NamedTuple,
+)
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
@@ -29,12 +48,23 @@ from .cli import (
     logger as exporter_logger,
 )
 
+try:  # Optional libdeflate bindings (``pip install deflate``)
+    import deflate  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - fallback to zlib
+    deflate = None  # type: ignore[assignment]
+
+try:  # Optional fast JSON serialisation
+    import orjson  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - fallback to json
+    orjson = None  # type: ignore[assignment]
+
 DEFAULT_ALLOWED_ORIGINS = [
     "http://localhost:3000",
     "http://127.0.0.1:3000",
 ]
 
 
+@functools.lru_cache(maxsize=1)
 def _load_allowed_origins() -> list[str]:
     """Return the list of CORS origins, optionally sourced from the environment."""
 
@@ -60,15 +90,83 @@ def _load_allowed_origins() -> list[str]:
     return DEFAULT_ALLOWED_ORIGINS
 
 
+_ALLOWED_ORIGINS = _load_allowed_origins()
+
+
+def _load_positive_int(name: str, default: int) -> int:
+    """Return a positive integer setting from the environment, or ``default``."""
+
+    configured = os.environ.get(name, "").strip()
+    if not configured:
+        return default
+
+    try:
+        value = int(configured)
+    except ValueError:
+        value = 0
+
+    if value > 0:
+        return value
+
+    exporter_logger.warning(
+        "%s must be a positive integer; falling back to %d.", name, default
+    )
+    return default
+
+
+DEFAULT_JOB_TTL_MINUTES = 30
+JOB_TTL = timedelta(minutes=_load_positive_int("JOB_TTL", DEFAULT_JOB_TTL_MINUTES))
+REAPER_INTERVAL_SECONDS = 60
+
+# Parent of every job directory and the default archive cache. WEBEXP_TMP can
+# point at fast storage; otherwise a private temp dir is removed at exit.
+BASE_TMP = os.environ.get("WEBEXP_TMP")
+if BASE_TMP:
+    os.makedirs(BASE_TMP, exist_ok=True)
+else:
+    BASE_TMP = tempfile.mkdtemp(prefix="webexp-root-")
+    atexit.register(shutil.rmtree, BASE_TMP, ignore_errors=True)
+
+# Finished archives are kept here, keyed by the SHA-256 of the export options,
+# so identical exports within ``JOB_TTL`` skip the crawl and zip stages.
+ARCHIVE_CACHE_DIR = os.environ.get("WEBEXP_CACHE_DIR") or os.path.join(BASE_TMP, "cache")
+os.makedirs(ARCHIVE_CACHE_DIR, exist_ok=True)
+
+
+@asynccontextmanager
+async def _lifespan(application: FastAPI) -> AsyncIterator[None]:
+    """Run the export pool and finished-job reaper for the lifetime of the application."""
+
+    # Its size is the only admission limit; jobs stay "queued" until a worker is free.
+    pool = ThreadPoolExecutor(
+        max_workers=_load_positive_int("MAX_CONCURRENT_EXPORTS", DEFAULT_MAX_CONCURRENT_EXPORTS),
+        thread_name_prefix="webexp-job",
+    )
+    application.state.export_pool = pool
+    stop = threading.Event()
+    reaper = threading.Thread(
+        target=_reap_jobs_forever, args=(stop,), daemon=True, name="webexp-reaper"
+    )
+    reaper.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        application.state.export_pool = None
+        # Drop queued exports so shutdown only waits for the ones already running.
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
 app = FastAPI(
     title="Python Webflow Exporter API",
     version=VERSION_NUM,
     description="HTTP wrapper around the python-webflow-exporter CLI workflow.",
+    lifespan=_lifespan,
 )
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=_load_allowed_origins(),
+    allow_origins=_ALLOWED_ORIGINS,
     allow_methods=["*"],
     allow_headers=["*"],
 )
@@ -83,6 +181,42 @@ class ExportRequest(BaseModel):
     debug: bool = False
     silent: bool = False
     output_name: str | None = None
+    skip_cache: bool = False
+
+
+class _EventClock:
+    """Anchor cheap monotonic event offsets to the wall-clock start of a job."""
+
+    def __init__(self) -> None:
+        self.wall = datetime.utcnow()
+        self.mono = time.monotonic_ns()
+
+    def offset(self) -> int:
+        """Return the nanoseconds elapsed since the clock was created."""
+
+        return time.monotonic_ns() - self.mono
+
+    def render(self, events: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Return copies of ``events`` with ISO timestamps in place of offsets."""
+
+        rendered = []
+        for event in events:
+            payload = dict(event)
+            offset = payload.pop("t_ns")
+            timestamp = self.wall + timedelta(microseconds=offset // 1000)
+            rendered.append(
+                {"type": payload.pop("type"), "timestamp": timestamp.isoformat() + "Z", **payload}
+            )
+        return rendered
+
+
+class _JobState(NamedTuple):
+    """Fields of a job that must always be read and updated together."""
+
+    status: str
+    error: str | None = None
+    archive_path: str | None = None
+    archive_size: int | None = None
 
 
 class ExportJob:
@@ -93,60 +227,71 @@ class ExportJob:
         self.request = request
         self.output_dir = output_dir
         self.archive_name = _ensure_zip_suffix(request.output_name or "webflow-export.zip")
-        self.archive_path: str | None = None
-        self.archive_size: int | None = None
-        self.status = "queued"
-        self.error: str | None = None
-        self.created_at = datetime.utcnow()
+        self.state = _JobState(status="queued")
+        self.clock = _EventClock()
+        self.created_at = self.clock.wall
         self.updated_at = self.created_at
-        self.events: list[dict[str, Any]] = []
+        # deque.append is atomic, so progress events never wait on ``lock``,
+        # which only serialises writers of ``state``.
+        self.events: deque[dict[str, Any]] = deque()
         self.lock = threading.Lock()
+        self._rendered: list[dict[str, Any]] = []
+        self._render_lock = threading.Lock()
 
     def _touch(self) -> None:
         self.updated_at = datetime.utcnow()
 
-    def add_event(self, event: dict[str, Any]) -> None:
+    def _update(self, **changes: Any) -> None:
         with self.lock:
-            self.events.append(event)
+            self.state = self.state._replace(**changes)
             self._touch()
 
+    def add_event(self, event: dict[str, Any]) -> None:
+        self.events.append(event)
+        self._touch()
+
     def set_status(self, status: str) -> None:
-        with self.lock:
-            self.status = status
-            self._touch()
+        self._update(status=status)
 
     def set_error(self, message: str) -> None:
-        with self.lock:
-            self.error = message
-            self._touch()
+        self._update(error=message)
 
     def set_archive(self, path: str, size: int) -> None:
-        with self.lock:
-            self.archive_path = path
-            self.archive_size = size
-            self._touch()
+        self._update(archive_path=path, archive_size=size)
 
     def snapshot(self) -> Dict[str, Any]:
-        with self.lock:
-            return {
-                "job_id": self.id,
-                "status": self.status,
-                "events": list(self.events),
-                "error": self.error,
-                "file_ready": self.archive_path is not None and self.status == "complete",
-                "file_name": self.archive_name,
-                "archive_size": self.archive_size,
-                "updated_at": self.updated_at.isoformat() + "Z",
-            }
+        state = self.state
+        return {
+            "job_id": self.id,
+            "status": state.status,
+            "events": self.snapshot_events(),
+            "error": state.error,
+            "file_ready": state.archive_path is not None and state.status == "complete",
+            "file_name": self.archive_name,
+            "archive_size": state.archive_size,
+            "updated_at": self.updated_at.isoformat() + "Z",
+        }
 
     def snapshot_events(self) -> list[dict[str, Any]]:
-        with self.lock:
-            return list(self.events)
+        with self._render_lock:
+            # Events are only appended, so render each once. Index rather than
+            # iterate: the deque may grow while we read it.
+            new = [self.events[i] for i in range(len(self._rendered), len(self.events))]
+            self._rendered.extend(self.clock.render(new))
+            return list(self._rendered)
 
 
 JOB_STORE: dict[str, ExportJob] = {}
 JOB_LOCK = threading.Lock()
 
+DEFAULT_MAX_CONCURRENT_EXPORTS = 4
+
+
+def _fail_if_cancelled(job: ExportJob, future: Future[None]) -> None:
+    if future.cancelled():
+        job.set_error("Export cancelled because the server shut down before it started.")
+        job.set_status("error")
+
 
 def _register_job(job: ExportJob) -> None:
     with JOB_LOCK:
@@ -161,6 +306,47 @@ def _get_job(job_id: str) -> ExportJob:
     return job
 
 
+def _reap_expired_jobs() -> None:
+    """Forget finished jobs older than ``JOB_TTL`` and delete their files."""
+
+    cutoff = datetime.utcnow() - JOB_TTL
+    with JOB_LOCK:
+        expired = [
+            job
+            for job in JOB_STORE.values()
+            if job.state.status in {"complete", "error"} and job.updated_at < cutoff
+        ]
+        for job in expired:
+            del JOB_STORE[job.id]
+
+    for job in expired:
+        shutil.rmtree(job.output_dir, ignore_errors=True)
+
+
+def _reap_expired_archives() -> None:
+    """Delete cached archives (and abandoned partial copies) older than ``JOB_TTL``."""
+
+    cutoff = time.time() - JOB_TTL.total_seconds()
+    with os.scandir(ARCHIVE_CACHE_DIR) as entries:
+        for entry in entries:
+            try:
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+            except OSError:
+                continue
+
+
+def _reap_jobs_forever(stop: threading.Event) -> None:
+    """Reap expired jobs every ``REAPER_INTERVAL_SECONDS`` until ``stop`` is set."""
+
+    while not stop.wait(REAPER_INTERVAL_SECONDS):
+        try:
+            _reap_expired_jobs()
+            _reap_expired_archives()
+        except Exception:  # pragma: no cover - defensive
+            logging.getLogger(__name__).exception("Failed to reap expired export jobs")
+
+
 @app.get("/health")
 def healthcheck() -> Dict[str, Any]:
     """Simple health endpoint."""
@@ -175,13 +361,16 @@ def create_export_job(request: ExportRequest) -> Dict[str, str]:
     if request.debug and request.silent:
         raise HTTPException(status_code=400, detail="'debug' and 'silent' options cannot be combined")
 
-    job_id = uuid.uuid4().hex
-    output_dir = tempfile.mkdtemp(prefix=f"webexp-{job_id}-")
+    job_id = secrets.token_hex(16)
+    output_dir = tempfile.mkdtemp(prefix=f"{job_id}-", dir=BASE_TMP)
     job = ExportJob(job_id, request, output_dir)
+    try:
+        future = app.state.export_pool.submit(_run_export_job, job)
+    except (AttributeError, RuntimeError) as exc:
+        shutil.rmtree(output_dir, ignore_errors=True)
+        raise HTTPException(status_code=503, detail="Server is not accepting exports") from exc
     _register_job(job)
-
-    thread = threading.Thread(target=_run_export_job, args=(job,), daemon=True)
-    thread.start()
+    future.add_done_callback(functools.partial(_fail_if_cancelled, job))
 
     return {"job_id": job_id}
 
@@ -194,16 +383,28 @@ def export_progress(job_id: str) -> Dict[str, Any]:
     return job.snapshot()
 
 
+class _ArchiveResponse(FileResponse):
+    """FileResponse that streams archives in 1 MiB chunks.
+
+    Starlette hands the path to the server when it supports the
+    ``http.response.pathsend`` extension; otherwise larger reads keep the
+    number of read/send round-trips low for multi-GB archives.
+    """
+
+    chunk_size = 1 << 20
+
+
 @app.get("/exports/{job_id}/download")
 def download_export(job_id: str) -> FileResponse:
     """Send the finished archive for the given job."""
 
     job = _get_job(job_id)
-    if job.archive_path is None or job.status != "complete":
+    state = job.state
+    if state.archive_path is None or state.status != "complete":
         raise HTTPException(status_code=404, detail="Archive not ready")
 
-    return FileResponse(
-        job.archive_path,
+    return _ArchiveResponse(
+        state.archive_path,
         media_type="application/zip",
         filename=job.archive_name,
     )
@@ -212,19 +413,27 @@ def download_export(job_id: str) -> FileResponse:
 class _ProgressRecorder:
     """Collects progress events during an export."""
 
-    def __init__(self, on_event: Callable[[dict[str, Any]], None] | None = None) -> None:
+    def __init__(
+        self,
+        on_event: Callable[[dict[str, Any]], None] | None = None,
+        clock: _EventClock | None = None,
+    ) -> None:
         self.events: list[dict[str, Any]] = []
+        self.clock = clock or _EventClock()
         self._on_event = on_event
+        self.had_errors = False
 
     def add(self, event_type: str, **payload: Any) -> None:
-        """Store an event with a timestamp."""
+        """Store an event with its offset from the recorder's clock."""
 
         event: dict[str, Any] = {
             "type": event_type,
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "t_ns": self.clock.offset(),
         }
         event.update(payload)
         self.events.append(event)
+        if event_type == "log" and payload.get("level") == "error":
+            self.had_errors = True
 
         if self._on_event is not None:
             try:
@@ -234,53 +443,430 @@ class _ProgressRecorder:
 
 
 class _ProgressLogHandler(logging.Handler):
-    """Intercept downloader log messages and convert them into progress events."""
+    """Forward exporter log messages as progress ``log`` events."""
 
     def __init__(self, recorder: _ProgressRecorder) -> None:
         super().__init__(level=logging.INFO)
         self.recorder = recorder
-        self.output_root: str | None = None
 
     def emit(self, record: logging.LogRecord) -> None:  # noqa: D401 - signature required
         if record.levelno < logging.INFO:
             return
 
-        message = record.getMessage()
-        self.recorder.add("log", level=record.levelname.lower(), message=message)
+        self.recorder.add("log", level=record.levelname.lower(), message=record.getMessage())
 
-        if message.startswith("Downloading "):
-            remainder = message[len("Downloading ") :]
-            if " to " not in remainder:
-                return
 
-            source, target = remainder.split(" to ", 1)
-            source = source.strip()
-            target = target.strip()
-            target_display = target
+DEFAULT_ZIP_COMPRESS_LEVEL = 1
 
-            if self.output_root:
-                abs_target = os.path.abspath(target)
-                try:
-                    if os.path.commonpath([self.output_root, abs_target]) == self.output_root:
-                        target_display = os.path.relpath(abs_target, self.output_root)
-                except ValueError:
-                    target_display = abs_target
+# Formats that are already compressed; deflating them again only burns CPU.
+_STORED_EXTENSIONS = frozenset({".png", ".jpg", ".jpeg", ".webp", ".woff2", ".gz", ".mp4"})
 
-            self.recorder.add("download", source=source, target=target_display, status="start")
-            return
+# In-memory members up to this size are stored: DEFLATE overhead eats the saving.
+_STORED_MEMBER_MAX_SIZE = 4096
+
+_ZIP_WORKERS = min(32, os.cpu_count() or 1)
+_ZIP_WINDOW = 2 * _ZIP_WORKERS
+
+_ZIP_STORED = 0
+_ZIP_DEFLATED = 8
+_ZIP_VERSION = 20
+_ZIP64_VERSION = 45
+_ZIP_UTF8_FLAG = 0x800
+_ZIP32_LIMIT = 0xFFFFFFFF
+_ZIP32_MAX_ENTRIES = 0xFFFF
+
+# Files above this size are memory-mapped and compressed straight from the
+# page cache instead of being copied into a bytes object first.
+_MMAP_THRESHOLD = 64 * 1024
+
+
+def _load_compress_level() -> int:
+    """Return the DEFLATE level for export archives, optionally sourced from the environment."""
+
+    configured = os.environ.get("ZIP_COMPRESS_LEVEL", "").strip()
+    if not configured:
+        return DEFAULT_ZIP_COMPRESS_LEVEL
+
+    try:
+        level = int(configured)
+    except ValueError:
+        level = -1
+
+    if 0 <= level <= 9:
+        return level
+
+    exporter_logger.warning(
+        "ZIP_COMPRESS_LEVEL must be an integer between 0 and 9; falling back to %d.",
+        DEFAULT_ZIP_COMPRESS_LEVEL,
+    )
+    return DEFAULT_ZIP_COMPRESS_LEVEL
 
-        if message.startswith("Downloaded "):
-            # Messages like "Downloaded image: <url>"
-            parts = message.split(":", 1)
-            url = parts[1].strip() if len(parts) == 2 else message[len("Downloaded ") :].strip()
-            if url:
-                self.recorder.add("download", source=url, status="complete")
+
+ZIP_COMPRESS_LEVEL = _load_compress_level()
+
+
+def _crc32(data: bytes) -> int:
+    """Return the CRC-32 of ``data``, preferring libdeflate when available."""
+
+    if deflate is not None:
+        return deflate.crc32(data)
+    return zlib.crc32(data)
+
+
+def _deflate_bytes(data: bytes, level: int = ZIP_COMPRESS_LEVEL) -> tuple[int, bytes]:
+    """Return the CRC-32 and raw DEFLATE stream for ``data``."""
+
+    if deflate is not None:
+        return _crc32(data), bytes(deflate.deflate_compress(data, level))
+
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return _crc32(data), compressor.compress(data) + compressor.flush()
+
+
+@contextmanager
+def _read_view(path: str) -> Iterator[bytes | mmap.mmap]:
+    """Yield the contents of ``path``, memory-mapped when the file is large."""
+
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        size = os.fstat(fd).st_size
+        if size > _MMAP_THRESHOLD:
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as view:
+                yield view
+        else:
+            yield os.read(fd, size)
+    finally:
+        os.close(fd)
+
+
+def _deflate_file(path: str, level: int = ZIP_COMPRESS_LEVEL) -> tuple[int, bytes, int]:
+    """Return the CRC-32, raw DEFLATE stream and uncompressed size of a file."""
+
+    with _read_view(path) as data:
+        crc, payload = _deflate_bytes(data, level)
+        return crc, payload, len(data)
+
+
+def _checksum_file(path: str) -> tuple[int, int]:
+    """Return the CRC-32 and size of a file without keeping its contents."""
+
+    with _read_view(path) as data:
+        return _crc32(data), len(data)
+
+
+class _ZipEntry(NamedTuple):
+    """An archive member; stored files are streamed from ``source`` when written."""
+
+    arcname: str
+    crc: int
+    payload: bytes
+    size: int
+    method: int = _ZIP_DEFLATED
+    source: str | None = None
+
+
+def _encode_file(path: str, arcname: str) -> _ZipEntry:
+    """Read and encode a file, storing formats that are already compressed."""
+
+    if os.path.splitext(path)[1].lower() in _STORED_EXTENSIONS:
+        crc, size = _checksum_file(path)
+        return _ZipEntry(arcname, crc, b"", size, method=_ZIP_STORED, source=path)
+    return _ZipEntry(arcname, *_deflate_file(path))
+
+
+def _dump_json(value: Any) -> bytes:
+    """Serialise ``value`` to compact UTF-8 JSON, using orjson when available."""
+
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+def _iter_files(root: str) -> Iterator[str]:
+    """Yield the paths of all files below ``root`` using ``os.scandir``."""
+
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry.path
+
+
+def _encode_files(
+    executor: ThreadPoolExecutor, members: Iterable[tuple[str, str]]
+) -> Iterator[_ZipEntry]:
+    """Encode ``(path, arcname)`` pairs on ``executor`` and yield entries in order.
+
+    At most ``_ZIP_WINDOW`` members are in flight, so only a bounded number of
+    compressed payloads (stored files are streamed) is held in memory at once.
+    """
+
+    pending: deque[Future[_ZipEntry]] = deque()
+    for path, arcname in members:
+        if len(pending) >= _ZIP_WINDOW:
+            yield pending.popleft().result()
+        pending.append(executor.submit(_encode_file, path, arcname))
+
+    while pending:
+        yield pending.popleft().result()
+
+
+class _ZipWriter:
+    """Write a ZIP archive from entries that were compressed or checksummed up front.
+
+    Local headers are emitted with their final sizes, so the writer never seeks
+    and only tracks the byte offset of each entry for the central directory.
+    """
+
+    def __init__(self, fileobj: BinaryIO) -> None:
+        self._fp = fileobj
+        self._offset = 0
+        self._central: list[bytes] = []
+        local_time = time.localtime()
+        self._dos_time = (
+            local_time.tm_hour << 11 | local_time.tm_min << 5 | local_time.tm_sec // 2
+        )
+        self._dos_date = (
+            (max(local_time.tm_year, 1980) - 1980) << 9
+            | local_time.tm_mon << 5
+            | local_time.tm_mday
+        )
+
+    @property
+    def size(self) -> int:
+        """Number of bytes written to the underlying file so far."""
+
+        return self._offset
+
+    def __enter__(self) -> "_ZipWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _emit(self, data: bytes) -> None:
+        self._fp.write(data)
+        self._offset += len(data)
+
+    def add(self, entry: _ZipEntry) -> None:
+        """Append an entry whose payload is already encoded with ``entry.method``.
+
+        Sizes and offsets beyond the ZIP32 limits are moved into ZIP64 extra
+        fields, mirroring what :mod:`zipfile` produces.
+        """
+
+        name = entry.arcname.encode("utf-8")
+        flags = 0 if name.isascii() else _ZIP_UTF8_FLAG
+        offset = self._offset
+        payload_size = entry.size if entry.source is not None else len(entry.payload)
+
+        zip64_sizes = max(entry.size, payload_size) >= _ZIP32_LIMIT
+        zip64_offset = offset >= _ZIP32_LIMIT
+        version = _ZIP64_VERSION if zip64_sizes or zip64_offset else _ZIP_VERSION
+
+        local_extra = b""
+        central_fields: list[int] = []
+        if zip64_sizes:
+            local_extra = struct.pack("<HHQQ", 1, 16, entry.size, payload_size)
+            central_fields += [entry.size, payload_size]
+        if zip64_offset:
+            central_fields.append(offset)
+        central_extra = (
+            struct.pack(f"<HH{len(central_fields)}Q", 1, 8 * len(central_fields), *central_fields)
+            if central_fields
+            else b""
+        )
+
+        header_sizes = (
+            (_ZIP32_LIMIT, _ZIP32_LIMIT) if zip64_sizes else (payload_size, entry.size)
+        )
+
+        self._emit(
+            struct.pack(
+                "<IHHHHHIIIHH",
+                0x04034B50,
+                version,
+                flags,
+                entry.method,
+                self._dos_time,
+                self._dos_date,
+                entry.crc,
+                *header_sizes,
+                len(name),
+                len(local_extra),
+            )
+            + name
+            + local_extra
+        )
+        if entry.source is not None:
+            with open(entry.source, "rb") as source:
+                shutil.copyfileobj(source, self._fp, 1 << 20)
+            self._offset += payload_size
+        else:
+            self._emit(entry.payload)
+
+        self._central.append(
+            struct.pack(
+                "<IHHHHHHIIIHHHHHII",
+                0x02014B50,
+                3 << 8 | version,
+                version,
+                flags,
+                entry.method,
+                self._dos_time,
+                self._dos_date,
+                entry.crc,
+                *header_sizes,
+                len(name),
+                len(central_extra),
+                0,
+                0,
+                0,
+                0o100644 << 16,
+                min(offset, _ZIP32_LIMIT),
+            )
+            + name
+            + central_extra
+        )
+
+    def writestr(self, arcname: str, data: bytes) -> None:
+        """Store ``data`` as ``arcname``, deflating it only when it is large enough."""
+
+        if len(data) <= _STORED_MEMBER_MAX_SIZE:
+            self.add(_ZipEntry(arcname, _crc32(data), data, len(data), method=_ZIP_STORED))
+        else:
+            self.add(_ZipEntry(arcname, *_deflate_bytes(data), len(data)))
+
+    def close(self) -> None:
+        """Write the central directory and end-of-central-directory records."""
+
+        count = len(self._central)
+        directory_offset = self._offset
+        for record in self._central:
+            self._emit(record)
+        directory_size = self._offset - directory_offset
+
+        if (
+            count >= _ZIP32_MAX_ENTRIES
+            or directory_offset >= _ZIP32_LIMIT
+            or directory_size >= _ZIP32_LIMIT
+        ):
+            zip64_end_offset = self._offset
+            self._emit(
+                struct.pack(
+                    "<IQHHIIQQQQ",
+                    0x06064B50,
+                    44,
+                    3 << 8 | _ZIP64_VERSION,
+                    _ZIP64_VERSION,
+                    0,
+                    0,
+                    count,
+                    count,
+                    directory_size,
+                    directory_offset,
+                )
+            )
+            self._emit(struct.pack("<IIQI", 0x07064B50, 0, zip64_end_offset, 1))
+
+        self._emit(
+            struct.pack(
+                "<IHHHHIIH",
+                0x06054B50,
+                0,
+                0,
+                min(count, _ZIP32_MAX_ENTRIES),
+                min(count, _ZIP32_MAX_ENTRIES),
+                min(directory_size, _ZIP32_LIMIT),
+                min(directory_offset, _ZIP32_LIMIT),
+                0,
+            )
+        )
+
+
+def _zip_directory(
+    export_root: str,
+    archive_path: str,
+    manifest: dict[str, Any],
+    recorder: _ProgressRecorder,
+) -> int:
+    """Archive ``export_root`` with the manifest and progress log; return its size."""
+
+    prefix_len = len(export_root) + 1
+    members = (
+        (file_path, file_path[prefix_len:].replace(os.sep, "/"))
+        for file_path in _iter_files(export_root)
+    )
+
+    # Compression releases the GIL; this thread appends finished entries in order.
+    with (
+        open(archive_path, "wb") as archive,
+        _ZipWriter(archive) as zf,
+        ThreadPoolExecutor(max_workers=_ZIP_WORKERS) as executor,
+    ):
+        for entry in _encode_files(executor, members):
+            zf.add(entry)
+        zf.writestr("manifest.json", _dump_json(manifest))
+
+        recorder.add("stage", name="zipped")
+        recorder.add("stage", name="complete")
+        zf.writestr("progress.json", _dump_json(recorder.clock.render(recorder.events)))
+
+    return zf.size
+
+
+def _archive_cache_key(request: ExportRequest) -> str:
+    """Return the content address of the archive produced for ``request``."""
+
+    options = request.model_dump(mode="json", include={"url", "remove_badge", "generate_sitemap"})
+    return hashlib.sha256(json.dumps(options, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _link_or_copy(source: str, target: str) -> None:
+    """Hard-link ``source`` to ``target``, copying when linking is not possible."""
+
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copyfile(source, target)
+
+
+def _restore_cached_archive(cache_key: str, archive_path: str) -> int | None:
+    """Link a fresh cached archive to ``archive_path`` and return its size.
+
+    Returns ``None`` when there is no cached archive younger than ``JOB_TTL``.
+    """
+
+    cached_path = os.path.join(ARCHIVE_CACHE_DIR, f"{cache_key}.zip")
+    try:
+        stat_result = os.stat(cached_path)
+        if time.time() - stat_result.st_mtime > JOB_TTL.total_seconds():
+            return None
+        _link_or_copy(cached_path, archive_path)
+    except OSError:
+        return None
+    return stat_result.st_size
+
+
+def _store_cached_archive(cache_key: str, archive_path: str) -> None:
+    """Publish a finished archive to the cache, replacing any older copy atomically."""
+
+    cached_path = os.path.join(ARCHIVE_CACHE_DIR, f"{cache_key}.zip")
+    partial_path = f"{cached_path}.{secrets.token_hex(16)}.part"
+    try:
+        _link_or_copy(archive_path, partial_path)
+        os.replace(partial_path, cached_path)
+    except OSError:  # pragma: no cover - caching is best effort
+        exporter_logger.warning("Failed to cache archive %s", archive_path, exc_info=True)
 
 
 def _run_export_job(job: ExportJob) -> None:
     """Execute an export job on a background thread."""
 
-    recorder = _ProgressRecorder(on_event=job.add_event)
+    recorder = _ProgressRecorder(on_event=job.add_event, clock=job.clock)
     handler = _ProgressLogHandler(recorder)
     handler.setFormatter(logging.Formatter('%(message)s'))
     exporter_logger.addHandler(handler)
@@ -288,40 +874,35 @@ def _run_export_job(job: ExportJob) -> None:
     job.set_status("running")
     recorder.add("stage", name="start")
 
-    try:
-        result = _execute_export_with_progress(
-            url=str(job.request.url),
-            output=os.path.join(job.output_dir, "export"),
-            remove_badge=job.request.remove_badge,
-            create_sitemap=job.request.generate_sitemap,
-            debug=job.request.debug,
-            silent=job.request.silent,
-            ensure_parent_dir=True,
-            recorder=recorder,
-            handler=handler,
-        )
-
-        manifest = result["assets"]
-
-        recorder.add("stage", name="zipping")
-        export_root = result["output_path"]
-        archive_path = os.path.join(job.output_dir, job.archive_name)
+    cache_key = _archive_cache_key(job.request)
+    archive_path = os.path.join(job.output_dir, job.archive_name)
 
-        with zipfile.ZipFile(archive_path, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
-            for root, _, files in os.walk(export_root):
-                for filename in files:
-                    file_path = os.path.join(root, filename)
-                    arcname = os.path.relpath(file_path, export_root)
-                    zf.write(file_path, arcname)
-            zf.writestr("manifest.json", json.dumps(manifest, indent=2))
+    try:
+        size = None
+        if not job.request.skip_cache:
+            size = _restore_cached_archive(cache_key, archive_path)
+        if size is not None:
+            recorder.add("stage", name="cache_hit")
+            recorder.add("stage", name="complete")
+        else:
+            result = _execute_export_with_progress(
+                url=str(job.request.url),
+                output=os.path.join(job.output_dir, "export"),
+                remove_badge=job.request.remove_badge,
+                create_sitemap=job.request.generate_sitemap,
+                debug=job.request.debug,
+                silent=job.request.silent,
+                ensure_parent_dir=True,
+                recorder=recorder,
+            )
+
+            recorder.add("stage", name="zipping")
+            size = _zip_directory(result["output_path"], archive_path, result["assets"], recorder)
+            # Exports with failed downloads are incomplete; never replay them from the cache.
+            if not recorder.had_errors:
+                _store_cached_archive(cache_key, archive_path)
 
-        size = os.path.getsize(archive_path)
         job.set_archive(archive_path, size)
-
-        recorder.add("stage", name="zipped")
-        recorder.add("stage", name="complete")
-        with zipfile.ZipFile(archive_path, mode="a", compression=zipfile.ZIP_DEFLATED) as zf:
-            zf.writestr("progress.json", json.dumps(recorder.events, indent=2))
         job.set_status("complete")
     except Exception as exc:  # pragma: no cover - defensive
         message = str(exc)
@@ -343,7 +924,6 @@ def _execute_export_with_progress(
     silent: bool,
     ensure_parent_dir: bool,
     recorder: _ProgressRecorder,
-    handler: _ProgressLogHandler | None,
 ) -> dict[str, Any]:
     """Run the exporter while recording progress information."""
 
@@ -368,8 +948,6 @@ def _execute_export_with_progress(
         check_url(url)
 
         output_path = os.path.abspath(output)
-        if handler is not None:
-            handler.output_root = output_path
 
         if not check_output_path_exists(output_path, create=ensure_parent_dir):
             raise ValueError("Output path does not exist. Please provide a valid path.")
@@ -378,7 +956,8 @@ def _execute_export_with_progress(
         clear_output_folder(output_path)
 
         recorder.add("stage", name="scanning")
-        assets_manifest = scan_html(url)
+        pages: Dict[str, str] = {}
+        assets_manifest = scan_html(url, pages=pages)
         recorder.add(
             "stage",
             name="scanned",
@@ -390,7 +969,9 @@ def _execute_export_with_progress(
         )
 
         recorder.add("stage", name="downloading")
-        download_assets(assets_manifest, output_path)
+        download_assets(
+            assets_manifest, output_path, progress_callback=recorder.add, pages=pages
+        )
         recorder.add("stage", name="downloaded")
 
         if remove_badge:
@@ -8,12 +8,18 @@ from urllib.parse import urlparse, urljoin
 import re
 import json
 import argparse
+import functools
 import os
 import sys
 import logging
+import mmap
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
+from xml.sax.saxutils import escape
 
 try:  # Python 3.10+
     from importlib.metadata import PackageNotFoundError, version as pkg_version
@@ -21,8 +27,16 @@ except ImportError:  # pragma: no cover - fallback for older runtimes
     from importlib_metadata import PackageNotFoundError, version as pkg_version  # type: ignore
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from selectolax.lexbor import LexborHTMLParser
 from halo import Halo
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.util.retry import Retry
+
+try:  # Optional fast JSON serialisation
+    import orjson  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - fallback to json
+    orjson = None  # type: ignore[assignment]
 
 try:  # Python 3.11+
     import tomllib  # type: ignore[attr-defined]
@@ -103,6 +117,47 @@ WEBFLOW_ASSET_HOSTS = {
     "d3e54v103j8qbb.cloudfront.net",
 }
 
+_HTTP_SCHEMES = frozenset({"http", "https"})
+
+# Absolute and protocol-relative URLs referenced from exported stylesheets.
+_CSS_URL_RE = re.compile(r'https?://[^\s"\')]+|//[^\s"\')]+')
+
+# One srcset candidate: a URL (which may itself contain commas, as data: URIs do)
+# followed either by separating commas or by descriptors up to the next comma.
+_SRCSET_RE = re.compile(r'[\s,]*(\S*[^\s,])(,+)?(?(2)|\s*([^,]*))')
+
+# Marker of the badge script in webflow.js and the checks patched to disable it.
+_BADGE_MARKER = b'class="w-webflow-badge"'
+_BADGE_REPLACEMENTS = (
+    (rb'/\.webflow\.io$/i.test(h)', b'false'),
+    (b'if(a){i&&e.remove();', b'if(true){i&&e.remove();'),
+)
+
+# Downloads are network-bound, so a handful of threads keeps the connection busy
+# while each one waits on its own round trip.
+DOWNLOAD_WORKERS = 16
+
+
+def _create_session():
+    """Return a session that keeps connections to the Webflow hosts alive."""
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=64,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_SESSION = _create_session()
+
 logger = logging.getLogger(__name__)
 
 stdout_log_formatter = logging.Formatter(
@@ -115,6 +170,7 @@ stdout_log_handler.setFormatter(stdout_log_formatter)
 logger.addHandler(stdout_log_handler)
 
 
+@functools.lru_cache(maxsize=8192)
 def normalize_asset_url(url):
     """Convert protocol-relative URLs into absolute HTTPS URLs."""
 
@@ -132,29 +188,49 @@ def is_webflow_asset_url(url):
     if not url:
         return False
 
-    normalized = normalize_asset_url(url)
-    parsed = urlparse(normalized)
-    if parsed.scheme not in {"http", "https"}:
+    _, parsed, host = _parse_asset_url(url)
+    if parsed.scheme not in _HTTP_SCHEMES:
         return False
 
-    host = parsed.netloc.lower()
     if host in WEBFLOW_ASSET_HOSTS:
         return True
 
-    return any(host.endswith(suffix) for suffix in WEBFLOW_ASSET_HOST_SUFFIXES)
+    return host.endswith(WEBFLOW_ASSET_HOST_SUFFIXES)
 
 
-def local_asset_path(asset_type, url):
-    """Return the relative local path for a downloaded asset."""
+@functools.lru_cache(maxsize=8192)
+def _parse_asset_url(url):
+    """Return ``(normalized, parsed, host)`` for ``url``, parsing each distinct URL once.
+
+    Only the parse is cached; the host lookup in ``is_webflow_asset_url`` stays live
+    so additions to ``WEBFLOW_ASSET_HOSTS`` take effect immediately.
+    """
 
     normalized = normalize_asset_url(url)
     parsed = urlparse(normalized)
+    return normalized, parsed, parsed.netloc.lower()
+
+
+@functools.lru_cache(maxsize=8192)
+def local_asset_path(asset_type, url):
+    """Return the relative local path for a downloaded asset."""
+
+    _, parsed, _ = _parse_asset_url(url)
     filename = os.path.basename(parsed.path)
     if not filename:
         return None
     return f"{asset_type}/{filename}"
 
 
+def _split_srcset(value):
+    """Return the ``(url, descriptor)`` candidates of a srcset-style attribute."""
+
+    return [
+        (match.group(1), (match.group(3) or '').strip())
+        for match in _SRCSET_RE.finditer(value)
+    ]
+
+
 def rewrite_srcset(value, asset_type):
     """Rewrite all URLs in a srcset-style attribute to local paths."""
 
@@ -162,17 +238,7 @@ def rewrite_srcset(value, asset_type):
         return value
 
     parts = []
-    for item in value.split(','):
-        piece = item.strip()
-        if not piece:
-            continue
-
-        if ' ' in piece:
-            url_part, descriptor = piece.split(' ', 1)
-            descriptor = descriptor.strip()
-        else:
-            url_part, descriptor = piece, ""
-
+    for url_part, descriptor in _split_srcset(value):
         normalized = normalize_asset_url(url_part)
         if is_webflow_asset_url(normalized):
             local_path = local_asset_path(asset_type, normalized)
@@ -186,6 +252,88 @@ def rewrite_srcset(value, asset_type):
 
     return ", ".join(parts)
 
+
+def _write_response(response, output_path):
+    """Stream ``response`` to ``output_path`` through a per-thread partial file.
+
+    Concurrent downloads may target the same file, so each writer renames its
+    own complete copy into place instead of sharing one file handle. Errors
+    from reading the raw stream are re-raised as ``requests.RequestException``.
+    """
+
+    partial_path = f"{output_path}.{threading.get_ident()}.part"
+    try:
+        # Let urllib3 undo any gzip/deflate transfer encoding while copying in 1 MiB blocks.
+        response.raw.decode_content = True
+        with open(partial_path, 'wb') as file:
+            try:
+                shutil.copyfileobj(response.raw, file, 1 << 20)
+            except Urllib3HTTPError as e:
+                raise requests.RequestException(e, response=response) from e
+        os.replace(partial_path, output_path)
+    except BaseException:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+        raise
+
+# Elements whose attributes may reference exported assets.
+_ASSET_SELECTOR = 'link, script, img, source, video, audio, meta'
+
+_PRELOAD_ASSET_TYPES = {
+    'style': 'css',
+    'script': 'js',
+    'font': 'images',
+    'image': 'images',
+}
+
+
+def _asset_attributes(node):
+    """Yield ``(attribute, asset_type, is_srcset)`` for each asset reference on ``node``."""
+
+    tag = node.tag
+    if tag == 'script':
+        yield 'src', 'js', False
+    elif tag == 'link':
+        rel_values = (node.attrs.get('rel') or '').lower().split()
+        if 'stylesheet' in rel_values:
+            yield 'href', 'css', False
+        if 'apple-touch-icon' in rel_values or rel_values == ['shortcut', 'icon']:
+            yield 'href', 'images', False
+        if 'preload' in rel_values:
+            as_attr = (node.attrs.get('as') or '').lower()
+            yield 'href', _PRELOAD_ASSET_TYPES.get(as_attr, 'images'), False
+    elif tag == 'meta':
+        yield 'content', 'images', False
+    else:
+        if tag == 'source':
+            parent = node.parent.tag if node.parent else ""
+            asset_type = 'media' if parent in {"video", "audio"} else 'images'
+        else:
+            asset_type = 'images' if tag == 'img' else 'media'
+        yield 'src', asset_type, False
+        yield 'srcset', asset_type, True
+        yield 'data-src', asset_type, False
+        yield 'data-srcset', asset_type, True
+
+
+def _meta_asset_url(base, content_value):
+    """Return the absolute URL a meta ``content`` value points at, if it is one."""
+
+    content_value = content_value.strip()
+    _, parsed_meta, _ = _parse_asset_url(content_value)
+    if parsed_meta.scheme in _HTTP_SCHEMES or content_value.startswith("//"):
+        return content_value
+    if content_value.startswith("/"):
+        return urljoin(base, content_value)
+    return None
+
+def _ensure_directory(path, known_dirs):
+    """Create ``path`` unless it is already recorded in ``known_dirs``."""
+
+    if path not in known_dirs:
+        os.makedirs(path, exist_ok=True)
+        known_dirs.add(path)
+
 def _spinner_start(spinner, text):
     """Helper to start a spinner if one was provided."""
 
@@ -239,13 +387,15 @@ def run_export(
         clear_output_folder(output_path)
 
         _spinner_start(spinner, 'Scraping the web...')
-        assets_manifest = scan_html(url, follow_internal_links=not single_page)
+        pages = {}
+        assets_manifest = scan_html(url, follow_internal_links=not single_page, pages=pages)
         _spinner_stop(spinner)
 
-        logger.debug("Assets found: %s", json.dumps(assets_manifest, indent=2))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Assets found: %s", _format_manifest(assets_manifest))
 
         _spinner_start(spinner, 'Downloading...')
-        download_assets(assets_manifest, output_path)
+        download_assets(assets_manifest, output_path, pages=pages)
         _spinner_stop(spinner)
 
         logger.info("Assets downloaded to %s", output_path)
@@ -270,6 +420,15 @@ def run_export(
         logger.setLevel(previous_level)
 
 
+def _format_manifest(manifest):
+    """Return ``manifest`` as indented JSON with sorted lists for debug output."""
+
+    manifest = {key: sorted(values) for key, values in manifest.items()}
+    if orjson is not None:
+        return orjson.dumps(manifest, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(manifest, indent=2)
+
+
 def main():
     """Main function to handle command line arguments and initiate the scraping process."""
 
@@ -320,33 +479,35 @@ def check_url(url):
     """Check if the URL is a valid Webflow URL."""
 
     try:
-        request = requests.get(url, timeout=10)
+        request = _SESSION.get(url, timeout=10)
     except requests.RequestException as exc:
         raise ValueError(f"Failed to reach the provided URL: {exc}") from exc
 
     if request.status_code != 200:
         raise ValueError("Invalid URL. Please provide a valid Webflow URL.")
 
-    soup = BeautifulSoup(request.text, 'html.parser')
+    tree = LexborHTMLParser(request.text)
 
     webflow_indicators = []
 
     # Check 1: Links with "website-files.com" (existing check)
-    links = soup.find_all('link', href=True)
-    has_webflow_links = any("website-files.com" in link['href'] for link in links)
+    links = tree.css('link[href]')
+    has_webflow_links = any("website-files.com" in (link.attrs['href'] or '') for link in links)
     if has_webflow_links:
         webflow_indicators.append("website-files.com links")
 
     # Check 2: Scripts with "website-files.com" (especially webflow.js)
-    scripts = soup.find_all('script', src=True)
-    has_webflow_scripts = any("website-files.com" in script['src'] for script in scripts)
+    scripts = tree.css('script[src]')
+    has_webflow_scripts = any(
+        "website-files.com" in (script.attrs['src'] or '') for script in scripts
+    )
     if has_webflow_scripts:
         webflow_indicators.append("website-files.com scripts")
 
     # Check 3: Meta generator tag with "Webflow"
-    meta_generator = soup.find('meta', attrs={'name': 'generator', 'content': True})
+    meta_generator = tree.css_first('meta[name="generator"][content]')
     has_webflow_meta = (meta_generator and
-                        'webflow' in meta_generator.get('content', '').lower())
+                        'webflow' in (meta_generator.attrs['content'] or '').lower())
     if has_webflow_meta:
         webflow_indicators.append("Webflow meta generator")
 
@@ -377,314 +538,212 @@ def clear_output_folder(path):
     """Clear the output folder if it exists, or create it if it doesn't."""
 
     if os.path.exists(path):
-        for root, dirs, files in os.walk(path, topdown=False):
-            for name in files:
-                os.remove(os.path.join(root, name))
-            for name in dirs:
-                os.rmdir(os.path.join(root, name))
-    else:
-        os.makedirs(path)
+        shutil.rmtree(path)
+    os.makedirs(path)
+
+def scan_html(url, follow_internal_links=True, max_workers=DOWNLOAD_WORKERS, pages=None):
+    """Scan the website for assets and internal links and return a dictionary.
 
-def scan_html(url):
-    """Scan the website for assets and internal links and return a dictionary."""
+    Pages are crawled breadth-first; each level of newly discovered internal links
+    is fetched on up to ``max_workers`` threads. With ``follow_internal_links``
+    disabled only ``url`` itself is scanned. If a ``pages`` dict is given, it is
+    filled with each page's HTML, already rewritten to local asset paths, so
+    ``download_assets`` can save it without fetching and parsing it again.
+    """
 
     visited = set()
-    html = []
+    html = set()
     assets = {"css": set(), "js": set(), "images": set(), "media": set()}
 
     base_domain = urlparse(url).netloc
 
-    def recursive_scan(current_url):
-        current_url = current_url.rstrip("/")
-        if current_url in visited:
-            return
-        visited.add(current_url)
+    def scan_page(current_url):
+        """Collect the assets of one page and return the internal URLs it links to."""
 
         try:
-            response = requests.get(current_url, timeout=10)
+            response = _SESSION.get(current_url, timeout=10)
             response.raise_for_status()
-        except requests.RequestException:
-            return
+        except requests.RequestException as e:
+            logger.error("Failed to scan page %s: %s", current_url, e)
+            return []
 
         # Only scan HTML pages
-        if "text/html" not in response.headers.get("Content-Type", ""):
-            return
+        content_type = response.headers.get("Content-Type", "")
+        if "text/html" not in content_type:
+            return []
+
+        # Without a declared charset requests falls back to ISO-8859-1; read such
+        # pages as UTF-8, the same way process_html reads saved pages.
+        if "charset" not in content_type.lower():
+            response.encoding = "utf-8"
 
         logger.debug("Scanning %s", current_url)
         logger.debug("Found HTML page: %s", current_url)
 
-        html.append(current_url)
-        soup = BeautifulSoup(response.text, 'html.parser')
-
-        # Find internal links
-        for link in soup.find_all('a', href=True):
-            href = link['href']
-            joined_url = urljoin(current_url + "/", href)
-            parsed_url = urlparse(joined_url)
-
-            # Only follow internal links
-            if parsed_url.netloc == base_domain:
-                normalized_url = parsed_url.scheme + "://" + parsed_url.netloc + parsed_url.path
-                recursive_scan(normalized_url)
-
-        # Collect assets
-        for css in soup.find_all('link', rel="stylesheet"):
-            href = css.get('href')
-            if href:
-                css_url = normalize_asset_url(urljoin(current_url + "/", href))
-                if is_webflow_asset_url(css_url):
-                    assets["css"].add(css_url)
-                    logger.debug("Found CSS: %s", css_url)
-
-        for link in soup.find_all('link', rel=["apple-touch-icon", "shortcut icon"]):
-            href = link.get('href')
-            if href:
-                image_url = normalize_asset_url(urljoin(current_url + "/", href))
-                if is_webflow_asset_url(image_url):
-                    assets["images"].add(image_url)
-                    logger.debug("Found image file: %s", image_url)
-
-        for preload in soup.find_all('link', href=True):
-            rel_values = [rel.lower() for rel in preload.get('rel', [])]
-            if 'preload' not in rel_values:
+        html.add(current_url)
+        tree = LexborHTMLParser(response.text)
+        base = current_url + "/"
+
+        # Collect assets and internal links in one walk over the page
+        links = []
+        for node in tree.css('a, ' + _ASSET_SELECTOR):
+            attrs = node.attrs
+            if node.tag == 'a':
+                href = attrs.get('href')
+                if href:
+                    links.append(href)
                 continue
-            href = preload.get('href')
-            as_attr = preload.get('as', '').lower()
-            bucket_map = {
-                'style': 'css',
-                'script': 'js',
-                'font': 'images',
-                'image': 'images',
-            }
-            asset_bucket = bucket_map.get(as_attr, 'images')
-            preload_url = normalize_asset_url(urljoin(current_url + "/", href))
-            if is_webflow_asset_url(preload_url):
-                assets[asset_bucket].add(preload_url)
-                logger.debug("Found preload %s asset: %s", asset_bucket, preload_url)
-
-        for script in soup.find_all('script', src=True):
-            src = script['src']
-            if src:
-                js_url = normalize_asset_url(urljoin(current_url + "/", src))
-                if is_webflow_asset_url(js_url):
-                    assets["js"].add(js_url)
-                    logger.debug("Found Javascript file: %s", js_url)
-
-        for img in soup.find_all('img', src=True):
-            src = img['src']
-            if src:
-                img_url = normalize_asset_url(urljoin(current_url + "/", src))
-                if is_webflow_asset_url(img_url):
-                    assets["images"].add(img_url)
-                    logger.debug("Found image file: %s", img_url)
-
-            srcset = img.get('srcset')
-            if srcset:
-                for candidate in srcset.split(','):
-                    url_part = candidate.strip().split(' ')[0]
-                    candidate_url = normalize_asset_url(urljoin(current_url + "/", url_part))
-                    if is_webflow_asset_url(candidate_url):
-                        assets["images"].add(candidate_url)
-                        logger.debug("Found image file in srcset: %s", candidate_url)
-
-            data_src = img.get('data-src')
-            if data_src:
-                data_url = normalize_asset_url(urljoin(current_url + "/", data_src))
-                if is_webflow_asset_url(data_url):
-                    assets["images"].add(data_url)
-                    logger.debug("Found data-src image: %s", data_url)
-
-            data_srcset = img.get('data-srcset')
-            if data_srcset:
-                for candidate in data_srcset.split(','):
-                    url_part = candidate.strip().split(' ')[0]
-                    candidate_url = normalize_asset_url(urljoin(current_url + "/", url_part))
-                    if is_webflow_asset_url(candidate_url):
-                        assets["images"].add(candidate_url)
-                        logger.debug("Found data-srcset image: %s", candidate_url)
-
-        for source in soup.find_all('source'):
-            parent = source.parent.name if source.parent else ""
-            asset_bucket = "media" if parent in {"video", "audio"} else "images"
-            for attribute in ("src", "srcset", "data-src", "data-srcset"):
-                value = source.get(attribute)
+
+            for attribute, asset_type, is_srcset in _asset_attributes(node):
+                value = attrs.get(attribute)
                 if not value:
                     continue
-                items = value.split(',') if attribute.endswith('set') else [value]
-                for item in items:
-                    url_part = item.strip().split(' ')[0]
-                    candidate_url = normalize_asset_url(urljoin(current_url + "/", url_part))
-                    if is_webflow_asset_url(candidate_url):
-                        assets[asset_bucket].add(candidate_url)
-                        logger.debug("Found %s asset: %s", asset_bucket, candidate_url)
-
-        for media in soup.find_all(['video', 'audio'], src=True):
-            src = media['src']
-            if src:
-                media_url = normalize_asset_url(urljoin(current_url + "/", src))
-                if is_webflow_asset_url(media_url):
-                    assets["media"].add(media_url)
-                    logger.debug("Found media file: %s", media_url)
-
-        for meta in soup.find_all('meta', content=True):
-            content_value = meta['content'].strip()
-            if not content_value:
-                continue
+                if attribute == 'content':
+                    candidates = [_meta_asset_url(base, value)]
+                elif is_srcset:
+                    candidates = [urljoin(base, url_part) for url_part, _ in _split_srcset(value)]
+                else:
+                    candidates = [urljoin(base, value)]
 
-            parsed_meta = urlparse(normalize_asset_url(content_value))
-            if parsed_meta.scheme in {"http", "https"} or content_value.startswith("//"):
-                meta_url = normalize_asset_url(content_value)
-            elif content_value.startswith("/"):
-                meta_url = normalize_asset_url(urljoin(current_url + "/", content_value))
-            else:
-                continue
+                for candidate in candidates:
+                    asset_url = normalize_asset_url(candidate)
+                    if is_webflow_asset_url(asset_url):
+                        assets[asset_type].add(asset_url)
+                        logger.debug("Found %s asset in <%s %s>: %s",
+                                     asset_type, node.tag, attribute, asset_url)
 
-            if is_webflow_asset_url(meta_url):
-                assets["images"].add(meta_url)
-                logger.debug("Found meta asset: %s", meta_url)
+            if pages is not None:
+                _rewrite_node_assets(node)
 
-    recursive_scan(url)
+        if pages is not None:
+            pages[current_url] = tree.html
+
+        # Only follow internal links
+        internal_urls = []
+        for href in links:
+            parsed_url = urlparse(urljoin(base, href))
+            if parsed_url.netloc == base_domain:
+                normalized_url = parsed_url.scheme + "://" + parsed_url.netloc + parsed_url.path
+                internal_urls.append(normalized_url)
+        return internal_urls
+
+    frontier = [url]
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="webexp-scan") as executor:
+        while frontier:
+            batch = []
+            for page_url in frontier:
+                page_url = page_url.rstrip("/")
+                if page_url not in visited:
+                    visited.add(page_url)
+                    batch.append(page_url)
+
+            frontier = []
+            for internal_urls in executor.map(scan_page, batch):
+                if follow_internal_links:
+                    frontier.extend(internal_urls)
 
     return {
-        "html": sorted(html),
-        "css": sorted(assets["css"]),
-        "js": sorted(assets["js"]),
-        "images": sorted(assets["images"]),
-        "media": sorted(assets["media"])
+        "html": list(html),
+        "css": list(assets["css"]),
+        "js": list(assets["js"]),
+        "images": list(assets["images"]),
+        "media": list(assets["media"])
     }
 
-def download_assets(assets, output_folder):
-    """Download assets from the CDN and save them to the output folder."""
-    def download_file(url, output_path, asset_type):
+def download_assets(
+    assets, output_folder, progress_callback=None, max_workers=DOWNLOAD_WORKERS, pages=None
+):
+    """Download assets from the CDN and save them to the output folder.
+
+    Up to ``max_workers`` downloads run at once. Pages found in ``pages`` (as filled
+    by ``scan_html``) are written from there, already rewritten; other pages are
+    downloaded and rewritten with ``process_html``. ``progress_callback``, if given,
+    is called as ``progress_callback(event_type, **fields)`` for every download that
+    starts or completes.
+    """
+    known_dirs = set()
+    pages = pages or {}
+
+    def download_file(url, relative_path, asset_type):
+        output_path = os.path.join(output_folder, relative_path)
+        logger.info("Downloading %s to %s", url, output_path)
+        if progress_callback is not None:
+            progress_callback("download", source=url, target=relative_path, status="start")
+        if asset_type == 'html' and url in pages:
+            _ensure_directory(os.path.dirname(output_path), known_dirs)
+            with open(output_path, 'w', encoding='utf-8') as file:
+                file.write(pages[url])
+            return
         try:
-            response = requests.get(url, stream=True, timeout=10)
+            response = _SESSION.get(url, stream=True, timeout=10)
             response.raise_for_status()
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            with open(output_path, 'wb') as file:
-                for chunk in response.iter_content(chunk_size=8192):
-                    file.write(chunk)
+            _ensure_directory(os.path.dirname(output_path), known_dirs)
+            _write_response(response, output_path)
             if asset_type == 'html':
                 process_html(output_path)
             elif asset_type == 'css':
-                process_css(output_path, output_folder)
+                process_css(output_path, output_folder, progress_callback)
         except requests.RequestException as e:
             logger.error("Failed to download asset %s: %s", url, e)
 
-    for asset_type, urls in assets.items():
-        logger.debug("Downloading %s assets...", asset_type)
-        for url in urls:
-            parsed_uri = urlparse(url)
-
-            if asset_type == 'html':
-                page_path = parsed_uri.path.strip('/')
-                if page_path:
-                    relative_path = f"{page_path}.html"
+    futures = []
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="webexp-download")
+    with executor:
+        for asset_type, urls in assets.items():
+            logger.debug("Downloading %s assets...", asset_type)
+            for url in urls:
+                parsed_uri = urlparse(url)
+
+                if asset_type == 'html':
+                    page_path = parsed_uri.path.strip('/')
+                    if page_path:
+                        relative_path = f"{page_path}.html"
+                    else:
+                        relative_path = "index.html"
                 else:
-                    relative_path = "index.html"
-            else:
-                filename = os.path.basename(parsed_uri.path)
-                if not filename:
-                    logger.debug("Skipping %s asset with empty filename: %s", asset_type, url)
-                    continue
-                relative_path = os.path.join(asset_type, filename)
+                    filename = os.path.basename(parsed_uri.path)
+                    if not filename:
+                        logger.debug("Skipping %s asset with empty filename: %s", asset_type, url)
+                        continue
+                    relative_path = os.path.join(asset_type, filename)
 
-            output_path = os.path.join(output_folder, relative_path)
+                futures.append(executor.submit(download_file, url, relative_path, asset_type))
 
-            logger.info("Downloading %s to %s", url, output_path)
-            download_file(url, output_path, asset_type)
+    for future in futures:
+        future.result()
 
-def process_html(file):
-    """Process the HTML file to fix asset links and format the HTML."""
-
-    with open(file, 'r', encoding='utf-8') as f:
-        soup = BeautifulSoup(f, 'html.parser')
-
-    def rewrite_attribute(tag, attribute, asset_type):
-        value = tag.get(attribute)
-        if not value:
-            return
-        normalized = normalize_asset_url(value)
-        if is_webflow_asset_url(normalized):
-            local_path = local_asset_path(asset_type, normalized)
-            if local_path:
-                tag[attribute] = local_path
+def _rewrite_node_assets(tag):
+    """Point the asset attributes of ``tag`` at their local copies."""
 
-    def rewrite_srcset_attribute(tag, attribute, asset_type):
-        value = tag.get(attribute)
+    attrs = tag.attrs
+    for attribute, asset_type, is_srcset in _asset_attributes(tag):
+        value = attrs.get(attribute)
         if not value:
-            return
-        rewritten = rewrite_srcset(value, asset_type)
-        if rewritten:
-            tag[attribute] = rewritten
-
-    # Process JS
-    for tag in soup.find_all('script'):
-        rewrite_attribute(tag, 'src', 'js')
-
-    # Process CSS
-    for tag in soup.find_all('link', rel="stylesheet"):
-        rewrite_attribute(tag, 'href', 'css')
-
-    # Process links like favicons
-    for tag in soup.find_all('link', rel=["apple-touch-icon", "shortcut icon"]):
-        rewrite_attribute(tag, 'href', 'images')
-
-    # Process preload links
-    for tag in soup.find_all('link', href=True):
-        rel_values = [rel.lower() for rel in tag.get('rel', [])]
-        if 'preload' not in rel_values:
             continue
-        bucket_map = {
-            'style': 'css',
-            'script': 'js',
-            'font': 'images',
-            'image': 'images',
-        }
-        asset_type = bucket_map.get(tag.get('as', '').lower(), 'images')
-        rewrite_attribute(tag, 'href', asset_type)
-
-    # Process IMG
-    for tag in soup.find_all('img'):
-        rewrite_attribute(tag, 'src', 'images')
-        rewrite_srcset_attribute(tag, 'srcset', 'images')
-        rewrite_attribute(tag, 'data-src', 'images')
-        rewrite_srcset_attribute(tag, 'data-srcset', 'images')
-
-    # Process Media
-    for tag in soup.find_all(['video', 'audio']):
-        rewrite_attribute(tag, 'src', 'media')
-        rewrite_srcset_attribute(tag, 'srcset', 'media')
-        rewrite_attribute(tag, 'data-src', 'media')
-        rewrite_srcset_attribute(tag, 'data-srcset', 'media')
-
-    # Process SOURCE tags in media/picture elements
-    for tag in soup.find_all('source'):
-        parent = tag.parent.name if tag.parent else ""
-        asset_type = 'media' if parent in {"video", "audio"} else 'images'
-        rewrite_attribute(tag, 'src', asset_type)
-        rewrite_srcset_attribute(tag, 'srcset', asset_type)
-        rewrite_attribute(tag, 'data-src', asset_type)
-        rewrite_srcset_attribute(tag, 'data-srcset', asset_type)
-
-    # Process meta tags with asset URLs
-    for tag in soup.find_all('meta', content=True):
-        content_value = tag['content']
-        normalized = normalize_asset_url(content_value)
-        if is_webflow_asset_url(normalized):
-            local_path = local_asset_path('images', normalized)
+        if is_srcset:
+            rewritten = rewrite_srcset(value, asset_type)
+            if rewritten:
+                attrs[attribute] = rewritten
+        elif is_webflow_asset_url(value):
+            local_path = local_asset_path(asset_type, value)
             if local_path:
-                tag['content'] = local_path
+                attrs[attribute] = local_path
 
-    # Format and unminify the HTML
-    formatted_html = soup.prettify()
+def process_html(file):
+    """Process the HTML file to fix asset links."""
 
-    output_file = os.path.join(os.path.dirname(file), os.path.basename(file))
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(str(formatted_html))
+    with open(file, 'r', encoding='utf-8') as f:
+        tree = LexborHTMLParser(f.read())
+
+    for tag in tree.css(_ASSET_SELECTOR):
+        _rewrite_node_assets(tag)
+
+    with open(file, 'w', encoding='utf-8') as f:
+        f.write(tree.html)
 
     logger.debug("Processed %s", file)
 
-def process_css(file_path, output_folder):
+def process_css(file_path, output_folder, progress_callback=None):
     """Process the CSS file to fix asset links."""
 
     if not os.path.exists(file_path):
@@ -696,21 +755,21 @@ def process_css(file_path, output_folder):
         logger.info("Processing CSS file: %s", file_path)
 
         # Find all image URLs in the CSS content
-        raw_urls = set(re.findall(r'https?:\/\/[^\s"\')]+|\/\/[^\s"\')]+', content))
+        raw_urls = {match.group(0) for match in _CSS_URL_RE.finditer(content)}
         assets_map = {}
         downloaded = set()
+        known_dirs = set()
         css_dir = os.path.dirname(file_path)
 
         if raw_urls:
             logger.info("Found %d asset URLs in CSS file %s", len(raw_urls), file_path)
 
         for raw_url in raw_urls:
-            normalized_url = normalize_asset_url(raw_url)
+            normalized_url, parsed_url, _ = _parse_asset_url(raw_url)
             if not is_webflow_asset_url(normalized_url):
                 continue
 
-            parsed = urlparse(normalized_url)
-            asset_name = os.path.basename(parsed.path)
+            asset_name = os.path.basename(parsed_url.path)
             if not asset_name:
                 continue
 
@@ -720,23 +779,27 @@ def process_css(file_path, output_folder):
 
             if normalized_url not in downloaded and not os.path.exists(image_output_path):
                 try:
-                    response = requests.get(normalized_url, stream=True, timeout=10)
+                    response = _SESSION.get(normalized_url, stream=True, timeout=10)
                     response.raise_for_status()
-                    os.makedirs(os.path.dirname(image_output_path), exist_ok=True)
-                    with open(image_output_path, 'wb') as img_file:
-                        for chunk in response.iter_content(chunk_size=8192):
-                            img_file.write(chunk)
+                    _ensure_directory(os.path.dirname(image_output_path), known_dirs)
+                    _write_response(response, image_output_path)
                     logger.info("Downloaded image: %s", normalized_url)
+                    if progress_callback is not None:
+                        progress_callback("download", source=normalized_url, status="complete")
                 except requests.RequestException as e:
                     logger.error("Failed to download image %s: %s", normalized_url, e)
                 downloaded.add(normalized_url)
 
             assets_map[raw_url] = relative_path
 
-        # Replace CDN URLs with local paths for images
+        # Replace CDN URLs with local paths for images in a single pass. Longer URLs
+        # come first so one URL that prefixes another cannot be rewritten halfway.
         updated_content = content
-        for original_url, relative_path in assets_map.items():
-            updated_content = updated_content.replace(original_url, relative_path)
+        if assets_map:
+            pattern = re.compile('|'.join(
+                re.escape(url) for url in sorted(assets_map, key=len, reverse=True)
+            ))
+            updated_content = pattern.sub(lambda match: assets_map[match.group(0)], content)
         f.seek(0)
         f.write(updated_content)
         f.truncate()
@@ -751,29 +814,42 @@ def remove_badge_from_output(output_path):
         for file in files:
             if file.endswith(".js"):
                 file_path = os.path.join(root, file)
-                with open(file_path, 'r+', encoding='utf-8') as f:
-                    content = f.read()
-                    if content.find('class="w-webflow-badge"') != -1:
-                        logger.info("\nRemoving Webflow badge from %s", file_path)
-                        content = content.replace(r'/\.webflow\.io$/i.test(h)', 'false')
-                        content = content.replace('if(a){i&&e.remove();', 'if(true){i&&e.remove();')
-                        f.seek(0)
-                        f.write(content)
-                        f.truncate()
+                if not _file_contains(file_path, _BADGE_MARKER):
+                    continue
+                logger.info("\nRemoving Webflow badge from %s", file_path)
+                path = Path(file_path)
+                content = path.read_bytes()
+                for target, replacement in _BADGE_REPLACEMENTS:
+                    content = content.replace(target, replacement)
+                path.write_bytes(content)
+
+def _file_contains(file_path, needle):
+    """Return whether ``needle`` occurs in the file, without reading it into memory."""
+
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return False
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return mapped.find(needle) != -1
 
 def generate_sitemap(output_path, html_sites):
     """Generate a sitemap.xml file from the HTML files."""
     sitemap_path = os.path.join(output_path, "sitemap.xml")
+    current_date = datetime.now().strftime("%Y-%m-%d")
+    entries = ''.join(
+        f'  <url>\n'
+        f'    <loc>{escape(url)}</loc>\n'
+        f'    <lastmod>{current_date}</lastmod>\n'
+        f'  </url>\n'
+        for url in sorted(html_sites["html"])
+    )
     with open(sitemap_path, 'w', encoding='utf-8') as f:
-        f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
-        f.write('<urlset xmlns="http://www.sitemaps.org/schemas/sitemap-image/1.1">\n')
-        for url in html_sites["html"]:
-            f.write('  <url>\n')
-            f.write(f'    <loc>{url}</loc>\n')
-            current_date = datetime.now().strftime("%Y-%m-%d")
-            f.write(f'    <lastmod>{current_date}</lastmod>\n')
-            f.write('  </url>\n')
-        f.write('</urlset>\n')
+        f.write(
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap-image/1.1">\n'
+            f'{entries}'
+            '</urlset>\n'
+        )
 
     logger.info("Sitemap generated at %s", sitemap_path)
 